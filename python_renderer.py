@@ -1,9 +1,14 @@
+from pathlib import Path
+
 from jinja2 import Environment, FileSystemLoader
 
 from src.html_utils import syntax_highlight, add_indent_lines
 from src.renderer import Renderer, CodeBlock
 
-environment = Environment(loader=FileSystemLoader("templates/"))
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+environment = Environment(loader=FileSystemLoader(TEMPLATES_DIR), auto_reload=False)
+base_template = environment.get_template("base.html")
+codeline_template = environment.get_template("utils/codeline.html")
 r = Renderer()
 PYTHON_SYNTAX_HIGHLIGHT = {
     "keywords": ("if", "else", "for", "while", "not", "in", "range", "True", "False", "None"),
@@ -16,8 +21,6 @@ PYTHON_SYNTAX_HIGHLIGHT = {
 
 @r.node(type="program_entry_point")
 def program_entry_point(node):
-    template = environment.get_template("base.html")
-
     # Collect & render statements
     block = CodeBlock(r.indenter)
     for child in node["body"]:
@@ -27,9 +30,8 @@ def program_entry_point(node):
     lines = syntax_highlight(block.lines, **PYTHON_SYNTAX_HIGHLIGHT)
     lines = add_indent_lines(lines)
 
-    codeline_template = environment.get_template("utils/codeline.html")
     codelines = [codeline_template.render(line=line) for line in lines]
-    return template.render(body=codelines)
+    return base_template.render(body=codelines)
 
 
 @r.node(type="if_statement")
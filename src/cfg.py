@@ -1,13 +1,14 @@
 from __future__ import annotations
 from typing import Dict, List, Set, Optional, Any, Tuple, Callable, cast
 import networkx as nx
-import matplotlib.pyplot as plt
 from src.types import Node, NodeType
 from src.serializers.serializer import Serializer
 from collections import defaultdict, deque
 
 
 class BasicBlock:
+    __slots__ = ("id", "ast_nodes", "instructions", "is_entry", "is_exit")
+
     def __init__(self, block_id: str, ast_nodes=None):
         self.id = block_id
         self.ast_nodes = ast_nodes or []
@@ -34,6 +35,11 @@ class BasicBlock:
 class ControlFlowGraph(Serializer):
     def __init__(self):
         super().__init__()
+        self.reset()
+
+    def reset(self):
+        # Per-run state only: registered node handlers are kept. Fresh
+        # containers are created, so graphs returned earlier stay intact.
         self.graph = nx.DiGraph()
         self.blocks = {}
         self.entry_block = None
@@ -55,6 +61,8 @@ class ControlFlowGraph(Serializer):
         self.loops = []
         self.loop_headers = set()
 
+        self._loop_connectedness = None
+
     def _create_block(self) -> BasicBlock:
         self.current_block_id += 1
         block_id = f"block_{self.current_block_id}"
@@ -73,21 +81,7 @@ class ControlFlowGraph(Serializer):
             self.critical_edges.add((source.id, target.id))
 
     def generate_cfg(self, ast: Node) -> nx.DiGraph:
-        self.graph = nx.DiGraph()
-        self.blocks = {}
-        self.current_block_id = 0
-        self.dominators = {}
-        self.post_dominators = {}
-        self.immediate_dominators = {}
-        self.immediate_post_dominators = {}
-        self.dominator_tree = nx.DiGraph()
-        self.post_dominator_tree = nx.DiGraph()
-        self.back_edges = set()
-        self.critical_edges = set()
-        self.abnormal_edges = set()
-        self.impossible_edges = set()
-        self.loops = []
-        self.loop_headers = set()
+        self.reset()
         
         self.entry_block = self._create_block()
         self.entry_block.is_entry = True
@@ -113,8 +107,8 @@ class ControlFlowGraph(Serializer):
             
         node_type = node.get("type", "")
         
-        if node_type in self.serizlize_funcs:
-            handler = self.serizlize_funcs[cast(NodeType, node_type)]
+        handler = self.serialize_funcs.get(cast(NodeType, node_type))
+        if handler is not None:
             return handler(self, node, entry_block, exit_block)
         else:
             if entry_block is not None and not entry_block.is_entry: 
@@ -235,32 +229,31 @@ class ControlFlowGraph(Serializer):
         if self.entry_block is None:
             return
             
-        visited = set()
+        entry_id = self.entry_block.id
+        visited = {entry_id}
         finished = set()
-        
-        def dfs(node):
-            if node in visited and node not in finished:
-                self.back_edges.add((current_path[-1], node))
-                if node in self.dominators.get(current_path[-1], set()):
-                    
-                    self.loop_headers.add(node)
-                return
-                
-            if node in visited:
-                return
-                
-            visited.add(node)
-            current_path.append(node)
-            
-            for succ in self.graph.successors(node):
-                dfs(succ)
-            
-            current_path.pop()
-            finished.add(node)
-        
-        current_path = []
-        dfs(self.entry_block.id)
-        
+
+        # Iterative DFS: current_path[i] is the block whose successors are
+        # being walked by the iterator stack[i].
+        current_path = [entry_id]
+        stack = [iter(self.graph.successors(entry_id))]
+
+        while stack:
+            for succ in stack[-1]:
+                if succ not in visited:
+                    visited.add(succ)
+                    current_path.append(succ)
+                    stack.append(iter(self.graph.successors(succ)))
+                    break
+
+                if succ not in finished:
+                    self.back_edges.add((current_path[-1], succ))
+                    if succ in self.dominators.get(current_path[-1], set()):
+                        self.loop_headers.add(succ)
+            else:
+                stack.pop()
+                finished.add(current_path.pop())
+
         for src, dst in self.back_edges:
             self.graph[src][dst]['type'] = 'back'
     
@@ -268,25 +261,31 @@ class ControlFlowGraph(Serializer):
         if self.exit_block is None:
             return
         
+        # One reverse search instead of a path query per node
+        reaches_exit = nx.ancestors(self.graph, self.exit_block.id)
+        reaches_exit.add(self.exit_block.id)
+        
         for node in self.graph.nodes():
-            if node == self.exit_block.id:
+            if node in reaches_exit:
                 continue
                 
-            if not nx.has_path(self.graph, node, self.exit_block.id):
-                if node in self.blocks:
-                    self._add_edge(self.blocks[node], self.exit_block, edge_type="impossible")
-                    self.impossible_edges.add((node, self.exit_block.id))
+            if node in self.blocks:
+                self._add_edge(self.blocks[node], self.exit_block, edge_type="impossible")
+                self.impossible_edges.add((node, self.exit_block.id))
+                # Everything that reaches node now reaches the exit as well
+                reaches_exit |= nx.ancestors(self.graph, node)
+                reaches_exit.add(node)
     
     def is_reducible(self) -> bool:
         for src, dst in self.back_edges:
             if dst not in self.dominators.get(src, set()):
                 return False
         
-        forward_edges = [(u, v) for u, v, data in self.graph.edges(data=True) 
-                        if data.get('type', 'forward') == 'forward']
-        forward_graph = nx.DiGraph()
-        forward_graph.add_nodes_from(self.graph.nodes())
-        forward_graph.add_edges_from(forward_edges)
+        # Read-only view over the forward edges, no copy of the graph
+        forward_graph = nx.subgraph_view(
+            self.graph,
+            filter_edge=lambda u, v: self.graph[u][v].get('type', 'forward') == 'forward',
+        )
         
         if not nx.is_directed_acyclic_graph(forward_graph):
             return False
@@ -294,6 +293,13 @@ class ControlFlowGraph(Serializer):
         return True
     
     def get_loop_connectedness(self) -> int:
+        # Enumerating all simple paths is expensive; the graph is fixed once
+        # generate_cfg returns, so compute it once per run.
+        if self._loop_connectedness is None:
+            self._loop_connectedness = self._compute_loop_connectedness()
+        return self._loop_connectedness
+
+    def _compute_loop_connectedness(self) -> int:
         if not self.back_edges or self.entry_block is None:
             return 0
             
@@ -317,6 +323,9 @@ class ControlFlowGraph(Serializer):
         return max_connectedness
     
     def visualize(self, output_file: str = "cfg.png"):
+        # matplotlib is slow to import, so only pay for it when drawing
+        import matplotlib.pyplot as plt
+
         pos = nx.spring_layout(self.graph, seed=42)
         plt.figure(figsize=(14, 10))
         
@@ -325,8 +334,8 @@ class ControlFlowGraph(Serializer):
         entry_nodes = [n for n, block in self.blocks.items() if block.is_entry]
         exit_nodes = [n for n, block in self.blocks.items() if block.is_exit]
         loop_header_nodes = [n for n in self.loop_headers]
-        normal_nodes = [n for n in self.graph.nodes() if n not in entry_nodes and 
-                        n not in exit_nodes and n not in loop_header_nodes]
+        special_nodes = frozenset(entry_nodes).union(exit_nodes, loop_header_nodes)
+        normal_nodes = [n for n in self.graph.nodes() if n not in special_nodes]
         
         nx.draw_networkx_nodes(self.graph, pos, nodelist=entry_nodes, node_color='green', 
                             node_size=2000, alpha=0.8)
@@ -1,9 +1,13 @@
+from functools import lru_cache
 from typing import Iterable
 import re
 
 INDENT_STEP_PX = 25.7
 INDENT_OFFSET_PX = 2.6
 
+# Characters that must be escaped inside a regex character class
+_CHAR_CLASS_SPECIAL = frozenset("\\]^-[&~|")
+
 
 def add_indent_line(line: str, left_level: int = 0, left_px: int = INDENT_STEP_PX, left_offset_px: int = INDENT_OFFSET_PX) -> str:
     """ Adds to a line of text a span tag that shows vertical line for given level of indent. """
@@ -22,21 +26,77 @@ def add_indent_lines(
         left_px: inner constant
     """
     for line in lines:
-        first_nonspace = -1
-        for i, char in enumerate(line):
-            if char != " ":
-                first_nonspace = i
-                break
+        stripped = line.lstrip(" ")
+        first_nonspace = len(line) - len(stripped) if stripped else -1
 
         if first_nonspace != -1:
             left_level = (first_nonspace + 1) // 4
-
-            for i in range(1, left_level + 1):
-                line = add_indent_line(line, left_level=i, left_px=left_px)
+            line = _indent_prefix(left_level, left_px) + line
 
         yield line
 
 
+@lru_cache(maxsize=32)
+def _indent_prefix(left_level: int, left_px: float) -> str:
+    """ Indent line spans for levels 1..left_level, in the order add_indent_line would nest them. """
+    prefix = ""
+    for i in range(1, left_level + 1):
+        prefix = add_indent_line(prefix, left_level=i, left_px=left_px)
+    return prefix
+
+
+@lru_cache(maxsize=64)
+def _compile_highlight_regex(
+    keywords: tuple[str, ...],
+    special: tuple[str, ...],
+    comment: tuple[str, ...],
+    string: tuple[str, ...],
+    multiline_comments: tuple[tuple[str, str], ...],
+) -> re.Pattern:
+    """
+    Compiles one scanner regex for syntax_highlight. Each alternative is a
+    named group (string, comment, keyword, special), tried in that order, so
+    strings and comments shield their contents from keyword/special matches.
+    Cached, so every render with the same config reuses the compiled pattern.
+    """
+    groups = []
+
+    # --- Строковые литералы ---
+    strings = [
+        rf"{re.escape(q)}(?:\\.|[^{re.escape(q)}\\])*{re.escape(q)}" for q in string
+    ]
+    groups.append(("string", strings))
+
+    # --- Однострочные и многострочные комментарии ---
+    comments = [rf"{re.escape(c)}[^\n]*" for c in comment]
+    comments += [
+        rf"{re.escape(start)}[\s\S]*?{re.escape(end)}"
+        for start, end in multiline_comments
+    ]
+    groups.append(("comment", comments))
+
+    # --- Ключевые слова ---
+    if keywords:
+        escaped_keywords = [re.escape(k) for k in keywords]
+        groups.append(("keyword", [r"\b(?:" + "|".join(escaped_keywords) + r")\b"]))
+
+    # --- Спецсимволы ---
+    special_chars = "".join(
+        "\\" + c if c in _CHAR_CLASS_SPECIAL else c for c in special
+    )
+    groups.append(("special", [r"[" + special_chars + r"]"]))
+
+    return re.compile(
+        "|".join(f"(?P<{name}>{'|'.join(alts)})" for name, alts in groups if alts)
+    )
+
+
+def _highlight_match(match: re.Match) -> str:
+    if match.lastgroup == "string":
+        return match.group()
+    return f'<span class="{match.lastgroup}">{match.group()}</span>'
+
+
 def syntax_highlight(
     lines: Iterable[str],
     keywords: Iterable[str] = ("if", "else", "for", "while"),
@@ -47,71 +107,28 @@ def syntax_highlight(
 ) -> Iterable[str]:
     """
     Универсальная подсветка синтаксиса для кода на разных языках.
-    Данный код необходимо в будущем декомпозировать и переписать, но вряд ли
-    это когда случится...
+    Код размечается за один проход одним регулярным выражением.
     """
     code = "\n".join(lines)
 
-    # --- Ключевые слова ---
-    if keywords:
-        escaped_keywords = [re.escape(k) for k in keywords]
-        keyword_regex = re.compile(r"\b(" + "|".join(escaped_keywords) + r")\b")
-    else:
-        keyword_regex = None
-
-    # --- Спецсимволы ---
-    special_chars = "".join(
-        re.escape(c)
-        for c in (special if not isinstance(special, str) else list(special))
+    config = (
+        tuple(keywords),
+        tuple(special),
+        tuple(comment),
+        tuple(string),
+        tuple(tuple(pair) for pair in multiline_comments),
     )
-    special_regex = re.compile(r"([" + special_chars + r"])")
-
-    # --- Игнорируемые блоки: строки, однострочные комментарии, многострочные комментарии ---
-    ignore_patterns = []
-
-    # Строковые литералы
-    for q in string:
-        ignore_patterns.append(
-            rf"{re.escape(q)}(?:\\.|[^{re.escape(q)}\\])*{re.escape(q)}"
-        )
-
-    # Однострочные комментарии
-    for c in comment:
-        ignore_patterns.append(rf"{re.escape(c)}[^\n]*")
-
-    # Многострочные комментарии
-    for start, end in multiline_comments:
-        ignore_patterns.append(rf"{re.escape(start)}[\s\S]*?{re.escape(end)}")
-
-    # Общий паттерн
-    pattern = re.compile("|".join(ignore_patterns), re.MULTILINE)
-
-    result = []
-    last_end = 0
-
-    for match in pattern.finditer(code):
-        # Код между игнорируемыми фрагментами
-        segment = code[last_end : match.start()]
-        if keyword_regex:
-            segment = keyword_regex.sub(r'<span class="keyword">\1</span>', segment)
-        segment = special_regex.sub(r'<span class="special">\1</span>', segment)
-        result.append(segment)
-
-        matched_text = match.group(0)
-        if any(matched_text.startswith(c) for c in comment) or any(
-            matched_text.startswith(s) for s, _ in multiline_comments
-        ):
-            result.append(f'<span class="comment">{matched_text}</span>')
-        else:
-            result.append(matched_text)
-
-        last_end = match.end()
-
-    # Остаток
-    segment = code[last_end:]
-    segment = special_regex.sub(r'<span class="special">\1</span>', segment)
-    if keyword_regex:
-        segment = keyword_regex.sub(r'<span class="keyword">\1</span>', segment)
-    result.append(segment)
-
-    return "".join(result).splitlines(keepends=True)
+
+    return _highlight_code(code, config).splitlines(keepends=True)
+
+
+@lru_cache(maxsize=512)
+def _highlight_code(code: str, config: tuple) -> str:
+    """ Highlights the joined code; cached so repeated renders of the same code are free. """
+    pattern = _compile_highlight_regex(*config)
+    return pattern.sub(_highlight_match, code)
+
+
+def reset_highlight_cache() -> None:
+    """ Drops all cached highlight results. """
+    _highlight_code.cache_clear()
@@ -8,7 +8,8 @@ from typing import Dict, Optional, Any, Generator
 from contextlib import contextmanager
 
 
-JAR_PATH = Path("meaning_tree/modules/application/target/application-1.0-SNAPSHOT.jar")
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+JAR_PATH = PROJECT_ROOT / "meaning_tree/modules/application/target/application-1.0-SNAPSHOT.jar"
 
 logger = logging.getLogger(__name__)
 
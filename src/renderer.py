@@ -51,6 +51,14 @@ class Indenter:
         self._indent_level = 0
         self._count = count
         self._fill_value = fill_value
+        self._padding = ""
+
+    @property
+    def padding(self) -> str:
+        """
+        Строка отступа для текущего уровня.
+        """
+        return self._padding
 
     def indent(self, s: str) -> str:
         """
@@ -59,15 +67,20 @@ class Indenter:
         :param s: строка, к которой добавить отступ
         :return: строка с отступом
         """
-        indentation = self._fill_value * (self._indent_level * self._count)
-        return f"{indentation}{s}"
+        return self._padding + s
 
     def __enter__(self) -> Indenter:
         self._indent_level += 1
+        self._update_padding()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         self._indent_level = max(0, self._indent_level - 1)
+        self._update_padding()
+
+    def _update_padding(self) -> None:
+        # Строка отступа пересчитывается только при смене уровня
+        self._padding = self._fill_value * (self._indent_level * self._count)
 
 
 class CodeBlock:
@@ -98,4 +111,5 @@ class CodeBlock:
             line_or_lines = [line_or_lines]
         # Применяем отступ ко всем строкам внутри блока
         with self.indenter:
-            self.add([self.indenter.indent(line) for line in line_or_lines])
+            padding = self.indenter.padding
+            self.lines.extend(padding + line for line in line_or_lines)
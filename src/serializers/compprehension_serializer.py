@@ -1,4 +1,5 @@
-from typing import List, Any
+from itertools import chain, pairwise
+from typing import Callable, List
 from dataclasses import dataclass
 
 from src.types import Node
@@ -17,36 +18,27 @@ def serialize(node: Node) -> CompPrehensionQuestion:
     )
 
 
-@s.node(type="program_entry_point")
-def program_entry_point(node: Node) -> List[StatementFact]:
-    children = node["body"]
+def _block_handler(children_key: str) -> Callable[[Node], List[StatementFact]]:
+    """Builds the handler for a node that keeps its statements under children_key."""
 
-    stmt_facts = [StatementFact(node, "parent_of", child) for child in children]
+    def block_stmt(node: Node) -> List[StatementFact]:
+        children = node[children_key]
 
-    stmt_facts += [
-        StatementFact(sub, "next_sibling", obj)
-        for sub, obj in zip(children, children[1:])
-    ]
-
-    stmt_facts += flatten([s.serialize(child) for child in children])
-
-    return stmt_facts
+        stmt_facts = [StatementFact(node, "parent_of", child) for child in children]
 
+        stmt_facts += (
+            StatementFact(sub, "next_sibling", obj) for sub, obj in pairwise(children)
+        )
 
-@s.node(type="compound_statement")
-def compound_stmt(node: Node) -> List[StatementFact]:
-    children = node["statements"]
+        stmt_facts += chain.from_iterable(s.serialize(child) for child in children)
 
-    stmt_facts = [StatementFact(node, "parent_of", child) for child in children]
+        return stmt_facts
 
-    stmt_facts += [
-        StatementFact(sub, "next_sibling", obj)
-        for sub, obj in zip(children, children[1:])
-    ]
+    return block_stmt
 
-    stmt_facts += flatten([s.serialize(child) for child in children])
 
-    return stmt_facts
+program_entry_point = s.node(type="program_entry_point")(_block_handler("body"))
+compound_stmt = s.node(type="compound_statement")(_block_handler("statements"))
 
 
 @s.node(type="if_statement")
@@ -55,7 +47,7 @@ def if_stmt(node: Node) -> List[StatementFact]:
 
     stmt_facts = [StatementFact(node, "branches_item", branch) for branch in branches]
 
-    stmt_facts += flatten([s.serialize(child) for child in branches])
+    stmt_facts += chain.from_iterable(s.serialize(child) for child in branches)
 
     return stmt_facts
 
@@ -86,7 +78,9 @@ def cond_branch(node: Node) -> List[StatementFact]:
     ]
 )
 def binary_op(node: Node) -> List[StatementFact]:
-    return s.serialize(node["left_operand"]) + s.serialize(node["right_operand"])
+    stmt_facts = s.serialize(node["left_operand"])
+    stmt_facts += s.serialize(node["right_operand"])
+    return stmt_facts
 
 
 @s.nodes(
@@ -116,7 +110,9 @@ def int_literal(node: Node) -> List[StatementFact]:
 
 @s.node(type="assignment_statement")
 def assignment_stmt(node: Node) -> List[StatementFact]:
-    return s.serialize(node["target"]) + s.serialize(node["value"])
+    stmt_facts = s.serialize(node["target"])
+    stmt_facts += s.serialize(node["value"])
+    return stmt_facts
 
 
 @s.node(type="range_for_loop")
@@ -124,7 +120,7 @@ def for_stmt(node: Node) -> List[StatementFact]:
     # TODO: init statement fact?
     stmt_facts = [StatementFact(node, "body", node["body"])]
 
-    stmt_facts += flatten([s.serialize(stmt) for stmt in node["body"]])
+    stmt_facts += chain.from_iterable(s.serialize(stmt) for stmt in node["body"])
 
     return stmt_facts
 
@@ -135,18 +131,7 @@ def while_statement(node: Node) -> List[StatementFact]:
 
     stmt_facts = [StatementFact(node, "cond", cond), StatementFact(node, "body", body)]
 
-    stmt_facts += flatten(s.serialize(cond) + s.serialize(body))
+    stmt_facts += s.serialize(cond)
+    stmt_facts += s.serialize(body)
 
     return stmt_facts
-
-
-def flatten(lst: List[Any]) -> List[Any]:
-    result = []
-
-    for elem in lst:
-        if isinstance(elem, list):
-            result += flatten(elem)
-        else:
-            result.append(elem)
-
-    return result
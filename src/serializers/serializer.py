@@ -9,25 +9,27 @@ class SerializerNotFoundError(Exception):
 
 class Serializer:
     def __init__(self) -> None:
-        self.serizlize_funcs: Dict[NodeType, Any] = {}
+        self.serialize_funcs: Dict[NodeType, Any] = {}
 
     def node(self, *, type: NodeType):
         def decorator(func):
-            self.serizlize_funcs[type] = func
+            self.serialize_funcs[type] = func
             return func
 
         return decorator
 
     def nodes(self, *, types: List[NodeType]):
         def decorator(func):
-            [self.node(type=type)(func) for type in types]
+            for type in types:
+                self.serialize_funcs[type] = func
             return func
 
         return decorator
 
     def serialize(self, node: Node) -> Any:
         node_type = node.get("type")
-        if node_type in self.serizlize_funcs:
-            return self.serizlize_funcs[node_type](node)
+        func = self.serialize_funcs.get(node_type)
+        if func is not None:
+            return func(node)
 
         raise SerializerNotFoundError(f"No serializer function found for '{node_type}'")
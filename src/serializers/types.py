@@ -9,7 +9,7 @@ Verb = Literal[
 ]
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class StatementFact:
     subject_id: str
     subject_type: NodeType
@@ -25,7 +25,7 @@ class StatementFact:
         self.object_type = object["type"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompPrehensionQuestion:
     type: str
     name: str
@@ -0,0 +1,41 @@
+import inspect
+import sys
+
+from src.cfg import cfg
+
+
+def while_loop() -> dict:
+    return {
+        "type": "while_loop",
+        "condition": {"type": "identifier", "name": "a"},
+        "body": {
+            "type": "compound_statement",
+            "statements": [
+                {
+                    "type": "assignment_statement",
+                    "target": {"type": "identifier", "name": "b"},
+                    "value": {"type": "int_literal", "value": 1},
+                }
+            ],
+        },
+    }
+
+
+def test_sequential_loops_back_edges():
+    loop_count = 60
+    ast = {
+        "type": "program_entry_point",
+        "body": [while_loop() for _ in range(loop_count)],
+    }
+
+    # Every loop puts three blocks on the DFS path, so a walk that recursed
+    # per block would need ~180 frames and overflow this limit
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack(0)) + 100)
+    try:
+        cfg.generate_cfg(ast)
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+    assert len(cfg.back_edges) == loop_count
+    assert len(cfg.loop_headers) == loop_count
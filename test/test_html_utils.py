@@ -0,0 +1,53 @@
+from src.html_utils import syntax_highlight
+from java_renderer import JAVA_SYNTAX_HIGHLIGHT
+from python_renderer import PYTHON_SYNTAX_HIGHLIGHT
+
+
+def kw(word: str) -> str:
+    return f'<span class="keyword">{word}</span>'
+
+
+def sp(char: str) -> str:
+    return f'<span class="special">{char}</span>'
+
+
+def comment(text: str) -> str:
+    return f'<span class="comment">{text}</span>'
+
+
+def test_keyword_before_comment():
+    lines = syntax_highlight(["if (a) b; // c"], **JAVA_SYNTAX_HIGHLIGHT)
+
+    assert lines == [f"{kw('if')} {sp('(')}a{sp(')')} b{sp(';')} {comment('// c')}"]
+
+
+def test_keyword_before_string():
+    lines = syntax_highlight(['if (x == "while") y;'], **JAVA_SYNTAX_HIGHLIGHT)
+
+    assert lines == [
+        f'{kw("if")} {sp("(")}x {sp("=")}{sp("=")} "while"{sp(")")} y{sp(";")}'
+    ]
+
+
+def test_comment_opener_is_special_char():
+    # "/" and "*" are special chars, but must not be split out of comments
+    lines = syntax_highlight(
+        ["a = 1; // x / y", "while (a) /* if b * c */ c;"], **JAVA_SYNTAX_HIGHLIGHT
+    )
+
+    assert lines == [
+        f"a {sp('=')} 1{sp(';')} {comment('// x / y')}\n",
+        f"{kw('while')} {sp('(')}a{sp(')')} {comment('/* if b * c */')} c{sp(';')}",
+    ]
+
+
+def test_python_triple_quoted_string():
+    lines = syntax_highlight(
+        ['"""if x:', 'while y"""', "if a: # while"], **PYTHON_SYNTAX_HIGHLIGHT
+    )
+
+    assert lines == [
+        '"""if x:\n',
+        'while y"""\n',
+        f"{kw('if')} a{sp(':')} {comment('# while')}",
+    ]